@@ -1,5 +1,6 @@
 """Configuration management for the Allocine scraper."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
@@ -17,6 +18,10 @@ class ScraperConfig(BaseModel):
         output_csv_name: Name of the CSV output file
         pause_scraping: Tuple of (min, max) seconds to pause between requests
         append_result: Whether to append to existing CSV file
+        max_concurrency: Maximum number of listing and movie pages fetched at the same time
+        http_cache: Whether to keep HTTP responses in a cache revalidated on the next runs
+        parquet: Whether to also export the results to a Parquet file next to the CSV file
+        compress: Whether to write the CSV file gzip compressed, with a .gz suffix
     """
 
     number_of_pages: int = Field(default=10, gt=0, description="Number of pages to scrape")
@@ -27,6 +32,10 @@ class ScraperConfig(BaseModel):
         default=(2, 10), description="Min and max seconds to pause between requests"
     )
     append_result: bool = Field(default=False, description="Whether to append to existing CSV file")
+    max_concurrency: int = Field(default=4, gt=0, description="Maximum number of concurrent page requests")
+    http_cache: bool = Field(default=False, description="Whether to cache HTTP responses between runs")
+    parquet: bool = Field(default=False, description="Whether to also export the results to Parquet")
+    compress: bool = Field(default=False, description="Whether to gzip the output CSV file")
 
     @field_validator("pause_scraping")
     def validate_pause_range(cls, v: Tuple[int, int]) -> Tuple[int, int]:
@@ -37,9 +46,21 @@ class ScraperConfig(BaseModel):
 
     @property
     def full_output_path(self) -> Path:
-        """Get the full path to the output CSV file."""
+        """Get the full path to the output CSV file, ending with .gz if compressed."""
+        if self.compress:
+            return self.output_dir / f"{self.output_csv_name}.gz"
         return self.output_dir / self.output_csv_name
 
+    @property
+    def full_parquet_path(self) -> Path:
+        """Get the full path to the Parquet export, named after the CSV file."""
+        return (self.output_dir / self.output_csv_name).with_suffix(".parquet")
+
+    @property
+    def http_cache_path(self) -> Path:
+        """Get the path to the SQLite HTTP cache, stored next to the CSV file."""
+        return self.output_dir / "http_cache.sqlite"
+
 
 class Settings(BaseSettings):
     """Global settings for the Allocine scraper.
@@ -47,14 +68,18 @@ class Settings(BaseSettings):
     Attributes:
         base_url: Base URL for Allocine website
         user_agent: User agent string for requests
+        request_timeout: Seconds to wait for the server to connect or send data
         log_level: Logging level
     """
 
-    base_url: str = Field(default="http://www.allocine.fr/films/", description="Base URL for Allocine website")
+    base_url: str = Field(default="https://www.allocine.fr/films/", description="Base URL for Allocine website")
     user_agent: str = Field(
         default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         description="User agent string for requests",
     )
+    request_timeout: float = Field(
+        default=15.0, gt=0, description="Seconds to wait for the server to connect or send data"
+    )
     log_level: str = Field(
         default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$", description="Logging level"
     )
@@ -67,5 +92,15 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings, read from the environment on the first call only.
+
+    Returns:
+        The Settings instance shared by the whole process.
+    """
+    return Settings()
+
+
 # Global instances
-settings = Settings()
+settings = get_settings()
@@ -5,17 +5,57 @@ movie scraper with various options. It handles parameter validation,
 scraper initialization, and error reporting.
 
 Functions:
+    run_scraper: Run the scraper for a validated configuration, without Click.
     cli: Main CLI entry point that processes command line arguments.
 
 Example:
     $ python -m allocine_dataset_scraper.run --number_of_pages 5 --from_page 1
 """
 
+from typing import TYPE_CHECKING, Optional
+
 import click
-from loguru import logger
 
-from allocine_dataset_scraper.config import ScraperConfig, Settings
-from allocine_dataset_scraper.scraper import AllocineScraper
+if TYPE_CHECKING:
+    from allocine_dataset_scraper.config import ScraperConfig, Settings
+
+
+def run_scraper(config: "ScraperConfig", settings: Optional["Settings"] = None) -> None:
+    """Print the parameters of a run, then scrape Allocine with them.
+
+    The `cli` command is a thin adapter over this function, which can be
+    called directly to run several scrapings in one process without going
+    through Click.
+
+    Args:
+        config: Scraper configuration object.
+        settings: Optional settings object. If None, uses global settings.
+
+    Example:
+        >>> run_scraper(ScraperConfig(number_of_pages=5))
+    """
+    # imported here so that --help and argument errors don't load the scraper dependencies
+    from allocine_dataset_scraper.config import get_settings
+    from allocine_dataset_scraper.scraper import AllocineScraper
+
+    # written in one go, rather than one write and flush per line
+    click.echo(
+        "\n".join(
+            [
+                "Starting AlloCine scraper with parameters:",
+                f"- Pages to scrape: {config.number_of_pages} (starting from {config.from_page})",
+                f"- Output: {config.full_output_path}",
+                f"- Pause between requests: {config.pause_scraping[0]}-{config.pause_scraping[1]}s",
+                f"- Mode: {'Append' if config.append_result else 'Overwrite'}",
+                f"- Concurrent requests: {config.max_concurrency}",
+                f"- HTTP cache: {config.http_cache_path if config.http_cache else 'Disabled'}",
+                f"- Parquet export: {config.full_parquet_path if config.parquet else 'Disabled'}",
+            ]
+        )
+    )
+
+    scraper = AllocineScraper(config, settings=settings or get_settings())
+    scraper.scraping_movies()
 
 
 @click.command()
@@ -58,6 +98,33 @@ from allocine_dataset_scraper.scraper import AllocineScraper
     help="Append result to the output csv file",
     show_default=True,
 )
+@click.option(
+    "--max_concurrency",
+    default=4,
+    help="Maximum number of listing and movie pages fetched concurrently.",
+    show_default=True,
+)
+@click.option(
+    "--http_cache",
+    is_flag=True,
+    default=False,
+    help="Cache HTTP responses and revalidate them on the next runs (needs requests-cache).",
+    show_default=True,
+)
+@click.option(
+    "--parquet",
+    is_flag=True,
+    default=False,
+    help="Also export the results to a Parquet file next to the csv file (needs pyarrow).",
+    show_default=True,
+)
+@click.option(
+    "--compress",
+    is_flag=True,
+    default=False,
+    help="Write the csv file gzip compressed (adds a .gz suffix).",
+    show_default=True,
+)
 def cli(**kwargs) -> None:
     """Run the Allocine movie scraper with specified parameters.
 
@@ -72,6 +139,10 @@ def cli(**kwargs) -> None:
         output_csv_name: Name of output CSV file (default: "allocine_movies.csv")
         pause_scraping: Min and max seconds between requests (default: 2 10)
         append_result: Whether to append to existing file (default: False)
+        max_concurrency: Maximum number of concurrent page requests (default: 4)
+        http_cache: Whether to cache HTTP responses between runs (default: False)
+        parquet: Whether to also export the results to Parquet (default: False)
+        compress: Whether to gzip the output csv file (default: False)
 
     Raises:
         click.BadParameter: If any parameters are invalid
@@ -81,20 +152,23 @@ def cli(**kwargs) -> None:
     Example:
         $ fetch-allocine --number_of_pages 5 --from_page 1
     """
+    from pydantic import ValidationError
+
+    from allocine_dataset_scraper.config import ScraperConfig
+
     try:
         config = ScraperConfig(**kwargs)
+    except ValidationError as ex:
+        # all the checks live in ScraperConfig: report the first failing one as a usage error
+        error = ex.errors()[0]
+        raise click.BadParameter(error["msg"], param_hint=f"'--{error['loc'][0]}'") from ex
 
-        click.echo("Starting AlloCine scraper with parameters:")
-        click.echo(f"- Pages to scrape: {config.number_of_pages} (starting from {config.from_page})")
-        click.echo(f"- Output: {config.full_output_path}")
-        click.echo(f"- Pause between requests: {config.pause_scraping[0]}-{config.pause_scraping[1]}s")
-        click.echo(f"- Mode: {'Append' if config.append_result else 'Overwrite'}")
-
-        settings = Settings()
-        scraper = AllocineScraper(config, settings=settings)
-        scraper.scraping_movies()
+    try:
+        run_scraper(config)
 
     except Exception as e:
+        from loguru import logger
+
         logger.error(f"Error during scraping: {str(e)}")
         raise click.ClickException(str(e))
 
@@ -15,29 +15,56 @@ Example:
     >>> scraper.scraping_movies()
 """
 
+import asyncio
+import csv
 import datetime
+import gzip
+import importlib.util
+import io
 import os
 import re
 import sys
-import time
 import unicodedata
+import zlib
 from pathlib import Path
 from random import randrange
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Set, TextIO, Union
+from urllib.parse import urlsplit
 
-import bs4
-import dateparser
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from tqdm.auto import tqdm
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from allocine_dataset_scraper.config import ScraperConfig, Settings, settings
 
-logger.remove()
-logger.add("scraper.log", rotation="100 MB")
-logger.add(sys.stderr, level=settings.log_level)
+# pandas and dateparser are slow to import: they are only loaded when needed
+if TYPE_CHECKING:
+    import pandas as pd
+
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging(log_level: str) -> None:
+    """Set up the log file and the stderr sink of the scraper, once per process.
+
+    Called by the scraper rather than at import time, so importing the module
+    neither creates scraper.log nor replaces the sinks of the application.
+
+    Args:
+        log_level: Minimum level of the messages written to stderr.
+    """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+
+    logger.remove()
+    logger.add("scraper.log", rotation="100 MB")
+    logger.add(sys.stderr, level=log_level)
+    _LOGGING_CONFIGURED = True
 
 
 class AllocineScraper:
@@ -49,10 +76,13 @@ class AllocineScraper:
 
     Attributes:
         movie_infos (List[str]): List of movie attributes to collect.
-        df (pd.DataFrame): DataFrame storing the collected movie information.
+        rating_infos (List[str]): Subset of movie_infos extracted together by _get_movie_ratings.
         config (ScraperConfig): Configuration object containing scraping parameters.
         settings (Settings): Settings object containing global settings.
-        exclude_ids (List[int]): List of movie IDs to skip during scraping.
+        session (requests.Session): Pooled HTTP session reused for every request.
+        exclude_ids (Set[int]): Movie IDs to skip during scraping.
+        rows (List[Dict]): Movie information collected during this run, one dict per movie.
+        df (pd.DataFrame): DataFrame built from rows on access.
 
     Example:
         >>> config = ScraperConfig(number_of_pages=5)
@@ -76,7 +106,47 @@ class AllocineScraper:
         "summary",
     ]
 
-    df: pd.DataFrame = pd.DataFrame(columns=movie_infos)
+    rating_infos: List[str] = [
+        "press_rating",
+        "number_of_press_rating",
+        "spec_rating",
+        "number_of_spec_rating",
+    ]
+
+    # compiled once instead of going through the re module cache for every movie
+    _RE_NON_DIGIT = re.compile(r"\D")
+    _RE_MOVIE_ID = re.compile(r"cfilm=(\d+)")
+    # durations are displayed as "2h 02min", hours or minutes being omitted when null
+    _RE_DURATION = re.compile(r"(?:(\d+)\s*h)?\s*(?:(\d+)\s*min)?")
+
+    # release dates are displayed as "<day> <french month> <year>"
+    _FRENCH_MONTHS: Dict[str, int] = {
+        "janvier": 1,
+        "février": 2,
+        "fevrier": 2,
+        "mars": 3,
+        "avril": 4,
+        "mai": 5,
+        "juin": 6,
+        "juillet": 7,
+        "août": 8,
+        "aout": 8,
+        "septembre": 9,
+        "octobre": 10,
+        "novembre": 11,
+        "décembre": 12,
+        "decembre": 12,
+    }
+
+    # rating blocks are told apart by their title, mapped here to the rating_infos prefix
+    _RATING_AUDIENCES: Dict[str, str] = {"Presse": "press", "Spectateurs": "spec"}
+
+    # number of movies written to the CSV buffer between two flushes
+    _FLUSH_EVERY = 10
+
+    # listing pages scraped at once: the next listing is fetched while the movies of the current one
+    # are, instead of every listing page being fetched before the first movie
+    _PAGES_IN_FLIGHT = 2
 
     def __init__(self, config: ScraperConfig, settings: Settings = settings) -> None:
         """Initialize the Allocine scraper.
@@ -87,10 +157,34 @@ class AllocineScraper:
 
         Raises:
             FileNotFoundError: If append_result is True and the CSV file doesn't exist.
+            ImportError: If parquet is True and pyarrow isn't installed.
         """
+        _configure_logging(settings.log_level)
+
         self.config = config
         self.settings = settings
-        self.exclude_ids = []
+        self.exclude_ids: Set[int] = set()
+        self.rows: List[Dict] = []
+        self.session = self._create_session()
+        # getters are bound once, the ratings being extracted together by _get_movie_ratings
+        self._movie_getters = [
+            (info, getattr(self, "_get_movie_" + info)) for info in self.movie_infos if info not in self.rating_infos
+        ]
+        # movie links are absolute paths on the host of the listing pages
+        base_url = urlsplit(self.settings.base_url)
+        self._page_url = f"{self.settings.base_url}?page="
+        self._site_url = f"{base_url.scheme}://{base_url.netloc}"
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        # a later run of the same scraper appends to the file it created, keeping the movies of `rows`
+        self._csv_created = False
+        # with compress, rows are buffered as text and written to the gzip file as one member per flush
+        self._csv_buffer: Optional[io.StringIO] = None
+        self._gzip_file: Optional[BinaryIO] = None
+        self._rows_since_flush = 0
+        self._throttle_lock = asyncio.Lock()
+        self._next_request_time = 0.0
+        self._scheduled_ids: Set[int] = set()
 
         logger.info("Initializing Allocine Scraper...")
         logger.info(f"- Number of pages to scrap: {self.config.number_of_pages}")
@@ -100,10 +194,17 @@ class AllocineScraper:
         )
         logger.info(f"- Results will be stored in: <{self.config.full_output_path}>")
 
+        if self.config.parquet and importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("parquet requires pyarrow: pip install 'allocine-dataset-scraper[parquet]'")
+
         if self.config.append_result:
             try:
-                self.df = pd.read_csv(self.config.full_output_path)
-                self.exclude_ids = self.df["id"].dropna().astype(int).tolist()
+                import pandas as pd
+
+                if self.config.compress:
+                    self._truncate_incomplete_gzip_member(self.config.full_output_path)
+                ids = pd.read_csv(self.config.full_output_path, usecols=["id"])["id"]
+                self.exclude_ids = set(ids.dropna().astype(int))
                 logger.info(
                     f"""- The list to exclude movies already fetch has been initialize
                     -- Total movie listed: {len(self.exclude_ids)}"""
@@ -112,6 +213,78 @@ class AllocineScraper:
                 logger.error(f"Failed to load the csv {self.config.full_output_path} -- {ex}")
                 raise FileNotFoundError(f"Failed to load the csv {self.config.full_output_path} -- {ex}")
 
+    @property
+    def df(self) -> "pd.DataFrame":
+        """Get the movies scraped during this run as a DataFrame.
+
+        Returns:
+            A DataFrame with one row per movie and movie_infos as columns.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.rows, columns=self.movie_infos)
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by all the requests of the scraper.
+
+        Every request targets the same host, so keeping the connections alive
+        avoids a TCP and TLS handshake per movie. Transient errors are retried
+        with an exponential backoff. Compressed responses are requested with
+        every encoding urllib3 can decode, brotli included.
+
+        With http_cache enabled, responses are stored in a SQLite cache and
+        revalidated with their ETag / Last-Modified headers on the next runs,
+        so unchanged pages come back as bodiless 304 responses.
+
+        Returns:
+            A session with the headers set and a pooled, retrying adapter mounted.
+
+        Raises:
+            ImportError: If http_cache is enabled but requests-cache isn't installed.
+        """
+        if self.config.http_cache:
+            try:
+                from requests_cache import EXPIRE_IMMEDIATELY, CachedSession
+            except ImportError as ex:
+                raise ImportError(
+                    "http_cache requires requests-cache: pip install 'allocine-dataset-scraper[cache]'"
+                ) from ex
+
+            session: requests.Session = CachedSession(
+                self.config.http_cache_path,
+                backend="sqlite",
+                expire_after=EXPIRE_IMMEDIATELY,
+                cache_control=True,
+            )
+        else:
+            session = requests.Session()
+        session.headers.update(
+            {
+                "User-Agent": self.settings.user_agent,
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Accept-Language": "fr-FR,fr;q=0.9",
+            }
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            # one kept-alive connection per request in flight
+            pool_maxsize=self.config.max_concurrency,
+            # jittered backoff so concurrent requests throttled together don't all retry at once;
+            # a Retry-After header sent with a 429 or a 503 takes precedence over it
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                backoff_jitter=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
     def _get_page(self, page_number: int) -> requests.Response:
         """Fetch a movie listing page from Allocine.fr.
 
@@ -127,9 +300,9 @@ class AllocineScraper:
         Raises:
             requests.RequestException: If the page fetch fails due to network/HTTP errors.
         """
-        headers = {"User-Agent": self.settings.user_agent}
-        url = f"{self.settings.base_url}?page={page_number}"
-        response = requests.get(url, headers=headers)  # pragma: no cover
+        response = self.session.get(
+            self._page_url + str(page_number), timeout=self.settings.request_timeout
+        )  # pragma: no cover
         return response
 
     def _get_movie(self, url: str) -> requests.Response:
@@ -147,8 +320,7 @@ class AllocineScraper:
         Raises:
             requests.RequestException: If the page fetch fails due to network/HTTP errors.
         """
-        headers = {"User-Agent": self.settings.user_agent}
-        response = requests.get(f"{self.settings.base_url}{url}", headers=headers)  # pragma: no cover
+        response = self.session.get(self._site_url + url, timeout=self.settings.request_timeout)  # pragma: no cover
         return response
 
     def _randomize_waiting_time(self) -> int:
@@ -183,11 +355,44 @@ class AllocineScraper:
                 logger.error(f"Failed to create {path_dir}: {ex}")
                 raise OSError(f"Failed to create {path_dir}: {ex}")
 
+    @staticmethod
+    def _truncate_incomplete_gzip_member(path: Union[str, Path]) -> None:
+        """Drop the incomplete gzip member a killed run left at the end of a file.
+
+        Each flush of a compressed run writes a complete gzip member: only the
+        last one can be cut short. Its rows are lost, and will be scraped
+        again, but the file is readable and appendable again.
+
+        Args:
+            path: Path to the gzip compressed CSV file.
+        """
+        with open(path, "r+b") as gzip_file:
+            data = memoryview(gzip_file.read())
+            complete_length = 0
+            while complete_length < len(data):
+                # 16 + MAX_WBITS: a single member with its gzip header and trailer
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                position = complete_length
+                try:
+                    while not decompressor.eof and position < len(data):
+                        decompressor.decompress(data[position : position + (1 << 16)])
+                        position += 1 << 16
+                except zlib.error:
+                    break
+                if not decompressor.eof:
+                    break
+                complete_length = min(position, len(data)) - len(decompressor.unused_data)
+
+            if complete_length < len(data):
+                logger.warning(f"{path} ends with an incomplete gzip member: its rows are dropped")
+                gzip_file.truncate(complete_length)
+
     def _parse_page(self, page: requests.Response) -> List[str]:
         """Parse a movie listing page to extract movie URLs.
 
-        Extracts all movie URLs from a listing page. If append mode is enabled,
-        filters out movies that have already been scraped.
+        Extracts all movie URLs from a listing page and filters out movies that
+        have already been scraped, either in a previous run (append mode) or
+        earlier in this one, so they are not fetched again.
 
         Args:
             page: Response object containing the page content.
@@ -196,12 +401,22 @@ class AllocineScraper:
             List of relative URL paths to individual movie pages.
         """
 
-        parser = BeautifulSoup(page.content, "html.parser")
-        urls = [url.a["href"] for url in parser.find_all("h2", class_="meta-title")]
+        parser = LexborHTMLParser(page.content)
+        urls: List[str] = []
+        for title in parser.css("h2.meta-title"):
+            # the first link of each title, even nested in a wrapper; titles without one are skipped
+            link = title.css_first("a")
+            href = link.attributes.get("href") if link is not None else None
+            if href:
+                urls.append(href)
 
-        if self.config.append_result and self.exclude_ids:
+        if self.exclude_ids:
             ori_urls_len = len(urls)
-            urls = [url for url in urls if int(url.split("=")[-1].split(".")[0]) not in self.exclude_ids]
+            urls = [
+                url
+                for url in urls
+                if (movie_id := self._get_url_movie_id(url)) is None or movie_id not in self.exclude_ids
+            ]
             urls_len = len(urls)
             logger.info(
                 f"""{ori_urls_len - urls_len} / {ori_urls_len}
@@ -210,166 +425,485 @@ class AllocineScraper:
 
         return urls
 
+    def _get_url_movie_id(self, url: str) -> Optional[int]:
+        """Extract the movie ID from a movie page URL.
+
+        Args:
+            url: The relative URL path to the movie page.
+
+        Returns:
+            The movie ID, or None if the URL doesn't contain one: callers keep
+            such URLs out of exclude_ids and the scheduled IDs.
+        """
+        match = self._RE_MOVIE_ID.search(url)
+        return int(match.group(1)) if match else None
+
     def _parse_movie(self, page: requests.Response) -> None:
         """Parse a movie page and store the extracted information.
 
-        Extracts all available movie information and stores it in the DataFrame.
-        Automatically saves the updated DataFrame to CSV after each movie.
+        Args:
+            page: Response object containing the movie page content.
+        """
+        self._store_movie(self._extract_movie(page))
+
+    def _fetch_page(self, page_number: int) -> List[str]:
+        """Fetch a movie listing page and extract its movie URLs.
+
+        Meant to run in a worker thread, like `_fetch_movie`.
+
+        Args:
+            page_number: The page number to fetch (1-based indexing).
+
+        Returns:
+            List of relative URL paths to the movie pages not scraped yet.
+        """
+        return self._parse_page(self._get_page(page_number))
+
+    def _fetch_movie(self, url: str) -> Dict:
+        """Fetch a movie page and extract its information.
+
+        Meant to run in a worker thread: the request and the HTML parsing, done
+        by Lexbor without holding the GIL, can then overlap between movies.
+
+        Args:
+            url: The relative URL path to the movie page.
+
+        Returns:
+            The movie information, keyed by movie_infos.
+        """
+        return self._extract_movie(self._get_movie(url))
+
+    def _extract_movie(self, page: requests.Response) -> Dict:
+        """Extract all available movie information from a movie page.
+
+        Doesn't change the scraper state, so it can run in any thread.
 
         Args:
             page: Response object containing the movie page content.
+
+        Returns:
+            The movie information, keyed by movie_infos.
         """
-        parser = BeautifulSoup(page.content, "html.parser")
-        parser_movie = parser.find("main", {"id": "content-layout"})
+        parser = LexborHTMLParser(page.content)
+        parser_movie = parser.css_first("main#content-layout")
 
-        self._create_directory_if_not_exist(self.config.output_dir)
+        # e.g. a removed movie or a consent page: the movie is kept with all its infos to None
+        if parser_movie is None:
+            logger.error(f"<url:{page.url}>: no main#content-layout in the movie page")
+            return dict.fromkeys(self.movie_infos)
 
-        movie_datas: Dict = {}
+        movie_datas: Dict = self._get_movie_ratings(parser_movie)
 
-        for info in self.movie_infos:
+        for info, getter in self._movie_getters:
             try:
-                scraped_info = getattr(self, "_get_movie_" + info)(parser_movie)
-            except AttributeError as ex:  # pragma: no cover
+                scraped_info = getter(parser_movie)
+            except AttributeError as ex:
                 logger.error(f"<id:{movie_datas.get('id')}, info:{info}>: {ex}")
                 scraped_info = None
 
-            movie_datas[info] = [scraped_info]
+            movie_datas[info] = scraped_info
+
+        return movie_datas
+
+    def _store_movie(self, movie_datas: Dict) -> None:
+        """Keep a movie in `rows` and append it to the CSV file.
+
+        Movies whose ID has already been scraped are skipped.
+
+        Args:
+            movie_datas: Movie information, keyed by movie_infos.
+        """
+        if movie_datas["id"] in self.exclude_ids:
+            logger.info("<id:{}> has already been scraped", movie_datas["id"])
+            return
+
+        self.exclude_ids.add(movie_datas["id"])
+        self.rows.append(movie_datas)
+        self._write_row(movie_datas)
+
+    def _write_row(self, movie_datas: Dict) -> None:
+        """Append a movie to the output CSV file.
+
+        The output directory is created and the file opened on the first row,
+        then kept open for the rest of the run: it is truncated and given a
+        header, unless append_result is set or an earlier run of this scraper
+        created it. Rows go through a 64 KiB buffer,
+        or a text buffer gzipped when compress is set, flushed every
+        `_FLUSH_EVERY` movies and on close().
 
-        self.df = (
-            pd.concat([self.df, pd.DataFrame(movie_datas)], ignore_index=True)
-            if not self.df.empty
-            else pd.DataFrame(movie_datas, columns=self.movie_infos)
-        ).drop_duplicates(subset=["id"])
+        Args:
+            movie_datas: Movie information, keyed by movie_infos.
+        """
+        if self._csv_file is None or self._csv_writer is None:
+            self._create_directory_if_not_exist(self.config.output_dir)
+            append = self.config.append_result or self._csv_created
+            if self.config.compress:
+                self._gzip_file = open(self.config.full_output_path, "ab" if append else "wb")
+                self._csv_buffer = self._csv_file = io.StringIO(newline="")
+            else:
+                self._csv_file = open(
+                    self.config.full_output_path,
+                    "a" if append else "w",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=1 << 16,
+                )
+            self._csv_created = True
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.movie_infos)
+            if not append:
+                self._csv_writer.writeheader()
+
+        release_date = movie_datas["release_date"]
+        self._csv_writer.writerow(
+            {**movie_datas, "release_date": release_date.strftime("%Y-%m-%d") if release_date else None}
+        )
+        self._rows_since_flush += 1
+        if self._rows_since_flush >= self._FLUSH_EVERY:
+            self._flush_csv()
+
+    def _flush_csv(self) -> None:
+        """Write the rows buffered so far to the output CSV file.
 
-        self.df.to_csv(f"{self.config.full_output_path}", index=False)
+        With compress, they are written as a complete gzip member, read back
+        as one file with the others: a killed run leaves a readable file that
+        the next run can append to.
+        """
+        if self._gzip_file is not None and self._csv_buffer is not None:
+            rows = self._csv_buffer.getvalue()
+            if rows:
+                # level 1 keeps up with the scraping
+                self._gzip_file.write(gzip.compress(rows.encode("utf-8"), compresslevel=1))
+                self._csv_buffer.seek(0)
+                self._csv_buffer.truncate()
+            self._gzip_file.flush()
+        elif self._csv_file is not None:
+            self._csv_file.flush()
+        self._rows_since_flush = 0
+
+    def close(self) -> None:
+        """Close the output CSV file if it has been opened, and the pooled connections.
+
+        The session stays usable: new connections are opened on the next request.
+        """
+        self.session.close()
+        if self._csv_file is not None:
+            self._flush_csv()
+            self._csv_file.close()
+            if self._gzip_file is not None:
+                self._gzip_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            self._csv_buffer = None
+            self._gzip_file = None
+
+    def _write_parquet(self) -> None:
+        """Export the movies of this run to a Parquet file next to the CSV file.
+
+        Parquet files can't be appended to: in append mode, the movies already
+        in the Parquet file are read back and written again with the new ones.
+
+        Columns use the narrowest type holding their values: ratings out of 5
+        fit a float32, durations in minutes an uint16, and the few distinct
+        genres and nationalities are dictionary encoded, read back by pandas
+        as categories.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [
+                ("id", pa.int32()),
+                ("title", pa.string()),
+                ("release_date", pa.date32()),
+                ("duration", pa.uint16()),
+                ("genres", pa.dictionary(pa.int32(), pa.string())),
+                ("directors", pa.string()),
+                ("actors", pa.string()),
+                ("nationality", pa.dictionary(pa.int32(), pa.string())),
+                ("press_rating", pa.float32()),
+                ("number_of_press_rating", pa.uint32()),
+                ("spec_rating", pa.float32()),
+                ("number_of_spec_rating", pa.uint32()),
+                ("summary", pa.string()),
+            ]
+        )
+        table = pa.Table.from_pylist(
+            [
+                {
+                    **row,
+                    "release_date": row["release_date"].date() if row["release_date"] else None,
+                    "duration": row["duration"] if row["duration"] != "" else None,
+                }
+                for row in self.rows
+            ],
+            schema=schema,
+        )
+
+        path = self.config.full_parquet_path
+        if self.config.append_result and path.exists():
+            table = pa.concat_tables([pq.read_table(path, schema=schema), table])
+
+        self._create_directory_if_not_exist(self.config.output_dir)
+        pq.write_table(table, path, compression="zstd")
+        logger.info(f"Results are exported to {path}.")
 
     def scraping_movies(self) -> None:
         """Execute the movie scraping process.
 
-        This method orchestrates the entire scraping process, including:
+        Synchronous entry point running `scraping_movies_async` on a fresh
+        event loop, so callers don't have to deal with asyncio themselves.
+        """
+        asyncio.run(self.scraping_movies_async())
+
+    async def scraping_movies_async(self) -> None:
+        """Execute the movie scraping process concurrently.
+
+        This coroutine orchestrates the entire scraping process, including:
         - Fetching listing pages
         - Extracting movie URLs
         - Fetching and parsing individual movie pages
-        - Saving results to CSV
+        - Saving results to CSV, and to Parquet if enabled
+
+        Listing pages and movie pages all share the same request slots: up to
+        `max_concurrency` requests are in flight at a time, so the movies of a
+        listing page don't have to be done before the next page is fetched.
+        Only `_PAGES_IN_FLIGHT` listing pages are scraped at once, so movies
+        are stored as the run goes rather than after every listing page.
         """
 
         logger.info("Starting scraping movies from Allocine...")
 
-        for number in tqdm(
-            range(self.config.from_page, self.config.from_page + self.config.number_of_pages), desc="Pages"
-        ):
-            logger.info(f"Fetching Page {number}/{self.config.from_page + self.config.number_of_pages}")
-            time.sleep(self._randomize_waiting_time())
-            res_page = self._get_page(number)
-            urls_to_parse = self._parse_page(res_page)
-
-            for url in tqdm(
-                urls_to_parse,
-                desc="Movies",
-                leave=(number == (self.config.from_page + self.config.number_of_pages - 1)),
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        page_slots = asyncio.Semaphore(self._PAGES_IN_FLIGHT)
+        self._throttle_lock = asyncio.Lock()
+        self._next_request_time = 0.0
+        self._scheduled_ids = set()
+        last_page = self.config.from_page + self.config.number_of_pages - 1
+        pages = range(self.config.from_page, last_page + 1)
+
+        try:
+            with (
+                tqdm(total=len(pages), desc="Pages") as pages_progress,
+                tqdm(total=0, desc="Movies") as movies_progress,
             ):
-                logger.info(f"Fetching Movie {url}")
-                res_movie = self._get_movie(url)
-                self._parse_movie(res_movie)
-
-                self.exclude_ids.append(int(url.split("=")[-1].split(".")[0]))
-                sleep_timer = self._randomize_waiting_time()
-                logger.info(
-                    f"""Done Fetching {url}.
-                    Waiting {sleep_timer} sec before the next one..."""
+                await asyncio.gather(
+                    *(
+                        self._scrape_page(number, last_page, semaphore, page_slots, pages_progress, movies_progress)
+                        for number in pages
+                    )
                 )
-                time.sleep(sleep_timer)
-
-            sleep_timer = self._randomize_waiting_time()
-            logger.info(
-                f"""Done scraping page #{number}.
-                Waiting {sleep_timer} sec before the next one..."""
-            )
-            time.sleep(sleep_timer)
+        finally:
+            try:
+                if self.config.parquet:
+                    self._write_parquet()
+            finally:
+                self.close()
 
         logger.info("Done scraping Allocine.")
         logger.info(f"Results are stored in {self.config.output_csv_name}.")
 
+    async def _scrape_page(
+        self,
+        number: int,
+        last_page: int,
+        semaphore: asyncio.Semaphore,
+        page_slots: asyncio.Semaphore,
+        pages_progress: tqdm,
+        movies_progress: tqdm,
+    ) -> None:
+        """Fetch a listing page, then scrape its movies.
+
+        The listing page is fetched and parsed in a worker thread, keeping the
+        event loop free for the requests in flight. The request slot is then
+        released, so the movie requests of every page can take it.
+
+        Args:
+            number: The page number to fetch.
+            last_page: The number of the last page of the run, for the logs.
+            semaphore: Semaphore bounding the number of requests in flight.
+            page_slots: Semaphore bounding the number of listing pages scraped at once.
+            pages_progress: Progress bar of the listing pages.
+            movies_progress: Progress bar of the movies, grown with each listing page.
+        """
+        async with page_slots:
+            async with semaphore:
+                await self._throttle()
+                logger.info("Fetching Page {}/{}", number, last_page)
+                urls_to_parse = await asyncio.to_thread(self._fetch_page, number)
+
+            # a movie listed twice, even on pages scraped concurrently, is only fetched once
+            urls_to_parse = [url for url in urls_to_parse if self._schedule_movie(url)]
+            movies_progress.total = (movies_progress.total or 0) + len(urls_to_parse)
+            movies_progress.refresh()
+            await asyncio.gather(*(self._scrape_movie(url, semaphore, movies_progress) for url in urls_to_parse))
+
+        logger.info("Done scraping page #{}.", number)
+        pages_progress.update()
+
+    def _schedule_movie(self, url: str) -> bool:
+        """Claim a movie page for this run, so its URL is only fetched once.
+
+        Args:
+            url: The relative URL path to the movie page.
+
+        Returns:
+            True if the movie was not scheduled yet, False otherwise.
+        """
+        movie_id = self._get_url_movie_id(url)
+        if movie_id is None:
+            return True
+        if movie_id in self._scheduled_ids:
+            return False
+        self._scheduled_ids.add(movie_id)
+        return True
+
+    async def _scrape_movie(self, url: str, semaphore: asyncio.Semaphore, progress: tqdm) -> None:
+        """Fetch and parse a single movie page.
+
+        The blocking HTTP request and the parsing run in a worker thread so
+        several movies can be fetched and parsed at once. Storing the movie
+        stays on the event loop, which keeps the rows and the CSV file updates
+        single-threaded.
+
+        Args:
+            url: The relative URL path to the movie page.
+            semaphore: Semaphore bounding the number of requests in flight.
+            progress: Progress bar of the movies.
+        """
+        async with semaphore:
+            await self._throttle()
+            logger.info("Fetching Movie {}", url)
+            movie_datas = await asyncio.to_thread(self._fetch_movie, url)
+            self._store_movie(movie_datas)
+            logger.info("Done Fetching {}.", url)
+
+        progress.update()
+
+    async def _throttle(self) -> None:
+        """Wait until the next request is allowed to start.
+
+        Request starts are spaced by a random delay drawn from pause_scraping,
+        so the site sees the same request rate as with a pause after every
+        request, while the wait overlaps with the fetching and parsing of the
+        requests already in flight. Retry-After headers on 429/503 responses
+        are honoured by the session retries.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._throttle_lock:
+            delay = self._next_request_time - loop.time()
+            if delay > 0:
+                logger.info("Waiting {:.1f} sec before the next request...", delay)
+                await asyncio.sleep(delay)
+            self._next_request_time = loop.time() + self._randomize_waiting_time()
+
     @staticmethod
-    def _get_movie_id(movie: bs4.element.Tag) -> int:
+    def _get_movie_id(movie: LexborNode) -> int:
         """Private method to extract the movie ID from the movie page.
 
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
 
         Returns:
             The movie's unique identifier.
         """
 
-        movie_id = re.sub(r"\D", "", movie.find("span", {"class": "home"})["href"])
+        movie_id = AllocineScraper._RE_NON_DIGIT.sub("", movie.css_first("span.home").attributes["href"])
 
         return int(movie_id)
 
     @staticmethod
-    def _get_movie_title(movie: bs4.element.Tag) -> str:
+    def _get_movie_title(movie: LexborNode) -> str:
         """Private method to extract the movie title from the movie page.
 
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
 
         Returns:
             The movie's title.
         """
 
-        movie_title = movie.find("div", {"class": "titlebar-title"}).text.strip()
+        movie_title = movie.css_first("div.titlebar-title").text().strip()
 
         return movie_title
 
     @staticmethod
     def _get_movie_release_date(
-        movie: bs4.element.Tag,
+        movie: LexborNode,
     ) -> Optional[datetime.datetime]:
         """Private method to extract the movie release date from the movie page.
 
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
 
         Returns:
             The movie's release date or None if not found.
         """
 
-        movie_date = movie.find("span", {"class": "date"})
-        if movie_date:
-            movie_date = movie_date.text.strip()
-            movie_date = dateparser.parse(movie_date, date_formats=["%d %B %Y"])
-        return movie_date
+        movie_date = movie.css_first("span.date")
+        if not movie_date:
+            return None
+
+        date_text = movie_date.text().strip()
+        try:
+            day, month, year = date_text.lower().split()
+            return datetime.datetime(int(year), AllocineScraper._FRENCH_MONTHS[month], int(day))
+        except (KeyError, ValueError):
+            # unusual formats (e.g. "1er mai 2021" or "mars 2021") are left to dateparser
+            import dateparser
+
+            return dateparser.parse(date_text, date_formats=["%d %B %Y"])
 
     @staticmethod
-    def _get_movie_duration(movie: bs4.element.Tag) -> Optional[int]:
+    def _get_movie_duration(movie: LexborNode) -> Optional[int]:
         """Private method to extract the movie duration.
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
             The movie's duration in minutes or None if not found.
         """
 
-        movie_duration = movie.find("span", {"class": "spacer"}).next_sibling.strip()
+        movie_duration = movie.css_first("span.spacer").next.text().strip()
         if movie_duration != "":
-            duration_timedelta = pd.to_timedelta(movie_duration).components
-            movie_duration = duration_timedelta.hours * 60 + duration_timedelta.minutes
+            match = AllocineScraper._RE_DURATION.match(movie_duration)
+            if not match or not match.group(0):
+                return None
+            hours, minutes = match.groups()
+            return int(hours or 0) * 60 + int(minutes or 0)
 
         return movie_duration
 
     @staticmethod
-    def _get_movie_genres(movie: bs4.element.Tag) -> Optional[str]:
+    def _get_links(node: LexborNode) -> List[LexborNode]:
+        """Private method to select the a/span links of a node.
+
+        Links carry a class ending with "-link", not necessarily the last one
+        of their class attribute, so each class is checked on its own.
+        Args:
+            node: Lexbor node to search.
+        Returns:
+            The a and span descendants having a "-link" class, in document order.
+        """
+        return [
+            link
+            for link in node.css("a, span")
+            if any(css_class.endswith("-link") for css_class in (link.attributes.get("class") or "").split())
+        ]
+
+    @staticmethod
+    def _get_movie_genres(movie: LexborNode) -> Optional[str]:
         """Private method to extract the movie genre(s).
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
             The movie's genres or None if not found.
         """
-        div_genres = movie.find("div", {"class": "meta-body-item meta-body-info"})
+        div_genres = movie.css_first("div.meta-body-item.meta-body-info")
 
         if div_genres:
             movie_genres = [
-                genre.text
-                for genre in div_genres.find_all(["a", "span"], class_=re.compile(r".*-link$"))
-                if "\n" not in genre.text
+                genre_text
+                for genre in AllocineScraper._get_links(div_genres)
+                if "\n" not in (genre_text := genre.text())
             ]
 
             return ", ".join(movie_genres)
@@ -377,151 +911,107 @@ class AllocineScraper:
         return None
 
     @staticmethod
-    def _get_movie_directors(movie: bs4.element.Tag) -> Optional[str]:
+    def _get_movie_directors(movie: LexborNode) -> Optional[str]:
         """Private method to extract the movie director(s).
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
             The movie's directores or None if not found.
         """
-        div_directors = movie.find_all("div", {"class": "meta-body-item meta-body-direction meta-body-oneline"})
+        div_directors = movie.css_first("div.meta-body-item.meta-body-direction.meta-body-oneline")
 
         if div_directors:
-            movie_directors = [
-                director.text for director in div_directors[0].find_all(["a", "span"], class_=re.compile(r".*-link$"))
-            ]
+            movie_directors = [director.text() for director in AllocineScraper._get_links(div_directors)]
 
             return ", ".join(movie_directors)
 
         return None
 
     @staticmethod
-    def _get_movie_actors(movie: bs4.element.Tag) -> Optional[str]:
+    def _get_movie_actors(movie: LexborNode) -> Optional[str]:
         """Private method to extract the movie actor(s).
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
             The movie's actors or None if not found.
         """
-        div_actors = movie.find("div", {"class": "meta-body-item meta-body-actor"})
+        div_actors = movie.css_first("div.meta-body-item.meta-body-actor")
 
         if div_actors:
-            movie_actors = [actor.text for actor in div_actors.find_all(["a", "span"])][1:]
+            movie_actors = [actor.text() for actor in div_actors.css("a, span")][1:]
 
             return ", ".join(movie_actors)
 
         return None
 
     @staticmethod
-    def _get_movie_nationality(movie: bs4.element.Tag) -> str:
+    def _get_movie_nationality(movie: LexborNode) -> str:
         """Private method to extract the movie nationality.
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
            The movie's nationalities or None if not found.
         """
 
         movie_nationality = [
-            nationality.text.strip() for nationality in movie.find_all(["a", "span"], class_="nationality")
+            nationality.text().strip() for nationality in movie.css("a.nationality, span.nationality")
         ]
 
         return ", ".join(movie_nationality)
 
     @staticmethod
-    def _get_movie_press_rating(movie: bs4.element.Tag) -> Optional[float]:
-        """Private method to extract the movie rating according to the press.
+    def _get_movie_ratings(movie: LexborNode) -> Dict[str, Optional[float]]:
+        """Private method to extract the press and spectators ratings in a single pass.
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
-            The movie's rating according to the press or None if not found.
+            The movie's press and spectators ratings with their number of ratings,
+            each one being None if not found.
         """
 
-        # get all the available ratings
-        movie_ratings = movie.find_all("div", class_="rating-item")
-
-        for ratings in movie_ratings:
-            if "Presse" in ratings.text:
-                return float(re.sub(",", ".", ratings.find("span", {"class": "stareval-note"}).text))
-        return None
-
-    @staticmethod
-    def _get_movie_number_of_press_rating(movie: bs4.element.Tag) -> Optional[float]:
-        """Private method to extract the number of ratings from the press.
-        Args:
-            movie: BeautifulSoup Tag object containing movie information.
-        Returns:
-            The movie's number of ratings from the press or None if not found.
-        """
-
-        # get all the available ratings
-        movie_ratings = movie.find_all("div", class_="rating-item")
-
-        for ratings in movie_ratings:
-            if "Presse" in ratings.text:
-                return float(
-                    re.sub(
-                        r"\D",
-                        "",
-                        ratings.find("span", {"class": "stareval-review"}).text,
-                    )
+        movie_ratings: Dict[str, Optional[float]] = dict.fromkeys(AllocineScraper.rating_infos)
+        seen_audiences = set()
+
+        # walk the available ratings once, keeping the first block of each audience
+        for ratings in movie.css("div.rating-item"):
+            # only the title's own text is read, not the whole rating block
+            rating_title = ratings.css_first(".rating-title")
+            if rating_title is None:
+                continue
+            audience = AllocineScraper._RATING_AUDIENCES.get(rating_title.text(deep=False).strip())
+            if audience is None or audience in seen_audiences:
+                continue
+            seen_audiences.add(audience)
+
+            rating_note = ratings.css_first("span.stareval-note")
+            if rating_note:
+                movie_ratings[f"{audience}_rating"] = float(rating_note.text().replace(",", "."))
+
+            rating_review = ratings.css_first("span.stareval-review")
+            if rating_review:
+                # spectators reviews read "<n> notes, <m> critiques": keep the number of notes
+                movie_ratings[f"number_of_{audience}_rating"] = float(
+                    AllocineScraper._RE_NON_DIGIT.sub("", rating_review.text().split(",")[0])
                 )
-        return None
-
-    @staticmethod
-    def _get_movie_spec_rating(movie: bs4.element.Tag) -> Optional[float]:
-        """Private method to extract the movie rating according to the spectators.
-        Args:
-            movie: BeautifulSoup Tag object containing movie information.
-        Returns:
-            The movie's rating according to the spectators or None if not found.
-        """
-
-        # get all the available ratings
-        movie_ratings = movie.find_all("div", class_="rating-item")
-
-        for ratings in movie_ratings:
-            if "Spectateurs" in ratings.text:
-                return float(re.sub(",", ".", ratings.find("span", {"class": "stareval-note"}).text))
-
-        return None
 
-    @staticmethod
-    def _get_movie_number_of_spec_rating(movie: bs4.element.Tag) -> Optional[float]:
-        """Private method to extract the number of ratings from the spectators.
-        Args:
-            movie: BeautifulSoup Tag object containing movie information.
-        Returns:
-            The movie's number of ratings according to the spectators or None if not found.
-        """
-
-        # get all the available ratings
-        movie_ratings = movie.find_all("div", class_="rating-item")
-
-        for ratings in movie_ratings:
-            if "Spectateurs" in ratings.text:
-                return float(
-                    re.sub(
-                        r"\D",
-                        "",
-                        (ratings.find("span", {"class": "stareval-review"}).text.split(",")[0]),
-                    )
-                )
-        return None
+        return movie_ratings
 
     @staticmethod
-    def _get_movie_summary(movie: bs4.element.Tag) -> Optional[str]:
+    def _get_movie_summary(movie: LexborNode) -> Optional[str]:
         """Private method to extract the movie summary.
         Args:
-            movie: BeautifulSoup Tag object containing movie information.
+            movie: Lexbor node containing movie information.
         Returns:
             The movie's summary or None if not found.
         """
 
-        movie_summary = movie.find("section", {"class": "section ovw ovw-synopsis"}).find(
-            "div", {"class": "content-txt"}
-        )
+        movie_summary = movie.css_first("section.section.ovw.ovw-synopsis").css_first("div.content-txt")
 
         if movie_summary:
-            movie_summary = movie_summary.text.strip()
+            movie_summary = movie_summary.text().strip()
+            # most summaries are already NFKC: the checks are cheaper than a rebuilt copy,
+            # isascii() being a constant time flag lookup
+            if movie_summary.isascii() or unicodedata.is_normalized("NFKC", movie_summary):
+                return movie_summary
             return unicodedata.normalize("NFKC", movie_summary)
         return None
@@ -8,8 +8,8 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-from bs4 import BeautifulSoup
 from requests import Response
+from selectolax.lexbor import LexborHTMLParser
 
 from allocine_dataset_scraper.utils import read_file
 
@@ -81,29 +81,29 @@ def response_movie():
 
 
 @pytest.fixture
-def bs4_movie_page():
+def parsed_movie_page():
     """Fixture to movie page."""
     txt = read_file(str(Path(__file__).parent / "data/movie.txt"))
     resp = Response()
     resp.status_code = 200
     resp._content = str.encode(txt)
 
-    parser = BeautifulSoup(resp.content, "html.parser")
-    parser_movie = parser.find("main", {"id": "content-layout"})
+    parser = LexborHTMLParser(resp.content)
+    parser_movie = parser.css_first("main#content-layout")
 
     return parser_movie
 
 
 @pytest.fixture
-def bs4_movie_page_exception():
+def parsed_movie_page_exception():
     """Fixture to movie page exception."""
     txt = read_file(str(Path(__file__).parent / "data/movie_exception.txt"))
     resp = Response()
     resp.status_code = 200
     resp._content = str.encode(txt)
 
-    parser = BeautifulSoup(resp.content, "html.parser")
-    parser_movie = parser.find("main", {"id": "content-layout"})
+    parser = LexborHTMLParser(resp.content)
+    parser_movie = parser.css_first("main#content-layout")
 
     return parser_movie
 
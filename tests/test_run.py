@@ -5,11 +5,15 @@ in allocine_dataset_scraper.run. Tests cover parameter validation,
 error handling, and successful execution scenarios.
 """
 
+import subprocess
+import sys
+
 import pandas as pd
 import pytest
 from click.testing import CliRunner
 
-from allocine_dataset_scraper.run import cli
+from allocine_dataset_scraper.config import ScraperConfig
+from allocine_dataset_scraper.run import cli, run_scraper
 
 
 @pytest.mark.parametrize(
@@ -95,12 +99,28 @@ def test_run(
     assert f"- Output: {output_dir}/{output_csv_name}" in result.output
     assert f"- Pause between requests: {pause_scraping[0]}-{pause_scraping[1]}s" in result.output
     assert f"- Mode: {'Append' if append_result else 'Overwrite'}" in result.output
+    assert "- Concurrent requests: 4" in result.output
+    assert "- HTTP cache: Disabled" in result.output
+    assert "- Parquet export: Disabled" in result.output
     assert end_shape[1] == 13
     assert end_shape[0] > 0
     assert result.exit_code == 0
     assert not result.exception
 
 
+def test_run_scraper(tmp_path, capsys):
+    """Test running the scraper from Python, without going through Click.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path
+        capsys: Pytest fixture capturing the standard output
+    """
+    config = ScraperConfig(number_of_pages=1, output_dir=tmp_path, pause_scraping=(0, 1))
+    run_scraper(config)
+    assert "- Pages to scrape: 1 (starting from 1)" in capsys.readouterr().out
+    assert len(pd.read_csv(config.full_output_path)) == 1
+
+
 def test_run_with_invalid_directory(tmp_path):
     """Test error handling when output directory is invalid.
 
@@ -142,8 +162,9 @@ def test_run_with_invalid_pause_values():
             "5",  # max < min
         ],
     )
-    assert result.exit_code != 0
+    assert result.exit_code == 2
     assert "Error" in result.output
+    assert "'--pause_scraping'" in result.output
 
 
 @pytest.mark.parametrize("pages", [-1, 0, "abc"])
@@ -181,3 +202,28 @@ def test_run_output_file_permissions(tmp_path):
         ],
     )
     assert result.exit_code != 0
+
+
+def test_run_does_not_import_heavy_modules(tmp_path):
+    """Test that loading the CLI doesn't import the scraper nor its dependencies.
+
+    They are only needed once the scraping starts, so `--help` shouldn't pay for them.
+    Loading it shouldn't create the log file either.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, allocine_dataset_scraper.run; "
+            "print(*(module in sys.modules for module in ('allocine_dataset_scraper.scraper', 'pandas', 'pydantic')))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+    )
+    assert result.stdout.split() == ["False", "False", "False"]
+    assert not (tmp_path / "scraper.log").exists()
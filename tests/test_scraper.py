@@ -5,12 +5,18 @@ covering movie data extraction, parsing, error handling, and file operations.
 Tests use mocked responses to avoid actual web requests.
 """
 
+import asyncio
+import datetime
+import gzip
+
 import dateparser
 import pandas as pd
 import pytest
 from pydantic import ValidationError
+from requests import Response
+from selectolax.lexbor import LexborHTMLParser
 
-from allocine_dataset_scraper.config import ScraperConfig
+from allocine_dataset_scraper.config import ScraperConfig, get_settings, settings
 from allocine_dataset_scraper.scraper import AllocineScraper
 
 
@@ -38,6 +44,77 @@ def test__get_movie():
     assert resp.status_code == 200
 
 
+def test__create_session():
+    """Test HTTP session setup.
+
+    Verifies that the session sends the configured user agent, asks for
+    brotli compressed responses and reuses a pooled adapter with retries
+    for HTTPS requests.
+    """
+    config = ScraperConfig()
+    scraper = AllocineScraper(config)
+    adapter = scraper.session.get_adapter("https://www.allocine.fr/films/")
+    assert scraper.session.headers["User-Agent"] == scraper.settings.user_agent
+    assert "br" in scraper.session.headers["Accept-Encoding"]
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.backoff_jitter > 0
+    assert adapter.max_retries.respect_retry_after_header
+
+
+def test_urls_are_built_from_base_url():
+    """Test listing and movie URL prefixes.
+
+    Verifies that movie pages, linked with an absolute path, are fetched on
+    the host of the listing pages rather than below the listing path.
+    """
+    scraper = AllocineScraper(ScraperConfig())
+    assert scraper._page_url + "2" == "https://www.allocine.fr/films/?page=2"
+    assert (
+        scraper._site_url + "/film/fichefilm_gen_cfilm=338.html"
+        == "https://www.allocine.fr/film/fichefilm_gen_cfilm=338.html"
+    )
+
+
+def test_close_releases_session(tmp_path, monkeypatch):
+    """Test that close() releases the pooled connections of the session.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+        monkeypatch: Pytest fixture for modifying objects.
+    """
+    scraper = AllocineScraper(ScraperConfig(output_dir=tmp_path))
+    calls = []
+    monkeypatch.setattr(scraper.session, "close", lambda: calls.append(True))
+    scraper.close()
+    assert calls == [True]
+
+
+def test__create_session_pool_size():
+    """Test that the session keeps a connection per concurrent request."""
+    scraper = AllocineScraper(ScraperConfig(max_concurrency=32))
+    assert scraper.session.get_adapter("https://www.allocine.fr/")._pool_maxsize == 32
+
+
+def test__create_session_with_http_cache(tmp_path):
+    """Test HTTP session setup with the response cache enabled.
+
+    Verifies that responses are cached in a SQLite file next to the CSV,
+    while keeping the headers and the retrying adapter of the plain session.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    requests_cache = pytest.importorskip("requests_cache")
+    config = ScraperConfig(output_dir=tmp_path, http_cache=True)
+    scraper = AllocineScraper(config)
+    assert isinstance(scraper.session, requests_cache.CachedSession)
+    assert scraper.session.cache.db_path == config.http_cache_path
+    assert scraper.session.headers["User-Agent"] == scraper.settings.user_agent
+    assert scraper.session.get_adapter("https://www.allocine.fr/films/").max_retries.total == 3
+    scraper.close()
+
+
 def test__randomize_waiting_time():
     """Test random wait time generation.
 
@@ -49,6 +126,28 @@ def test__randomize_waiting_time():
     assert scraper._randomize_waiting_time() in pause_range
 
 
+def test__throttle():
+    """Test request throttling.
+
+    Verifies that the first request starts right away and that the next one
+    waits for the pause drawn from the configured range.
+    """
+    config = ScraperConfig(pause_scraping=(1, 2))
+    scraper = AllocineScraper(config)
+
+    async def throttle_twice():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await scraper._throttle()
+        first_wait = loop.time() - start
+        await scraper._throttle()
+        return first_wait, loop.time() - start
+
+    first_wait, second_wait = asyncio.run(throttle_twice())
+    assert first_wait < 0.5
+    assert second_wait >= 1
+
+
 def test__create_directory_if_not_exist(tmp_path):
     """Test directory creation functionality.
 
@@ -98,191 +197,248 @@ def test__parse_page(response_page):
     assert urls == urls_expected
 
 
-def test__get_movie_id(bs4_movie_page):
+def test__get_movie_id(parsed_movie_page):
     """Test movie ID extraction from page.
 
     Verifies that the movie ID is correctly extracted from the HTML content.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
+        parsed_movie_page: Fixture providing the parsed movie page node.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_id(bs4_movie_page)
+    val = scraper._get_movie_id(parsed_movie_page)
     val_expected = 275220
     assert val == val_expected
 
 
-def test__get_movie_title(bs4_movie_page):
+def test__get_movie_title(parsed_movie_page):
     """Test movie title extraction from page.
 
     Verifies that the movie title is correctly extracted and cleaned
     from the HTML content.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
+        parsed_movie_page: Fixture providing the parsed movie page node.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_title(bs4_movie_page)
+    val = scraper._get_movie_title(parsed_movie_page)
     val_expected = "Minuit dans l'univers"
     assert val == val_expected
 
 
-def test__get_movie_release_date(bs4_movie_page):
+def test__get_movie_release_date(parsed_movie_page):
     """Test movie release date extraction and parsing.
 
     Verifies that the release date is correctly extracted and parsed
     into a datetime object.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
+        parsed_movie_page: Fixture providing the parsed movie page node.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_release_date(bs4_movie_page)
+    val = scraper._get_movie_release_date(parsed_movie_page)
     val_expected = dateparser.parse("2020-12-23", date_formats=["%d %B %Y"])
     assert val == val_expected
 
 
-def test__get_movie_duration(bs4_movie_page):
+@pytest.mark.parametrize(
+    "date_text,date_expected",
+    [
+        ("7 février 2024", datetime.datetime(2024, 2, 7)),
+        ("15 Août 1999", datetime.datetime(1999, 8, 15)),
+        ("1er mai 2021", datetime.datetime(2021, 5, 1)),
+    ],
+)
+def test__get_movie_release_date_formats(date_text, date_expected):
+    """Test release date parsing of french dates.
+
+    Verifies that plain "<day> <month> <year>" dates are parsed directly and
+    that other formats fall back to dateparser.
+
+    Args:
+        date_text: Release date as displayed on the movie page.
+        date_expected: Expected parsed datetime.
+    """
+    movie = LexborHTMLParser(f'<main><span class="date">{date_text}</span></main>').css_first("main")
+    assert AllocineScraper._get_movie_release_date(movie) == date_expected
+
+
+def test__get_movie_duration(parsed_movie_page):
     """Test movie duration extraction and conversion.
 
     Verifies that the duration is correctly extracted and converted
     to minutes.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
+        parsed_movie_page: Fixture providing the parsed movie page node.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_duration(bs4_movie_page)
+    val = scraper._get_movie_duration(parsed_movie_page)
     val_expected = 122
     assert val == val_expected
 
 
-def test__get_movie_genres(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_genres(parsed_movie_page, parsed_movie_page_exception):
     """Test the page parser to retrieve movie genres"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_genres(bs4_movie_page)
+    val = scraper._get_movie_genres(parsed_movie_page)
     val_expected = "Drame, Science Fiction"
     assert val == val_expected
-    val = scraper._get_movie_genres(bs4_movie_page_exception)
+    val = scraper._get_movie_genres(parsed_movie_page_exception)
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_directors(bs4_movie_page, bs4_movie_page_exception):
+def test__parse_page_nested_links():
+    """Test that each title gives the URL of its first link, even nested in a wrapper.
+
+    Titles without a link, or whose link has no href, are skipped.
+    """
+    page = Response()
+    page.status_code = 200
+    page._content = (
+        b'<h2 class="meta-title"><span><a href="/film/fichefilm_gen_cfilm=1.html">A</a></span></h2>'
+        b'<h2 class="meta-title"><a href="/film/fichefilm_gen_cfilm=2.html">B</a>'
+        b'<a href="/film/fichefilm_gen_cfilm=2.html#trailer">B</a></h2>'
+        b'<h2 class="meta-title">No link</h2><h2 class="meta-title"><a>No href</a></h2>'
+    )
+    urls = AllocineScraper(ScraperConfig())._parse_page(page)
+    assert urls == ["/film/fichefilm_gen_cfilm=1.html", "/film/fichefilm_gen_cfilm=2.html"]
+
+
+def test__get_links():
+    """Test that links are found by any of their classes, as with a class regex per token."""
+    node = LexborHTMLParser(
+        '<div><a class="xXx blue-link link-more">A</a><span class="end-section-link ">B</span>'
+        '<span class="light">C</span><a>D</a><span class="link-more">E</span></div>'
+    ).css_first("div")
+    assert [link.text() for link in AllocineScraper._get_links(node)] == ["A", "B"]
+
+
+def test__get_movie_directors(parsed_movie_page, parsed_movie_page_exception):
     """Test the page parser to retrieve movie directors"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_directors(bs4_movie_page)
+    val = scraper._get_movie_directors(parsed_movie_page)
     val_expected = "George Clooney"
     assert val == val_expected
-    val = scraper._get_movie_directors(bs4_movie_page_exception)
+    val = scraper._get_movie_directors(parsed_movie_page_exception)
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_actors(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_actors(parsed_movie_page, parsed_movie_page_exception):
     """Test the page parser to retrieve movie actors"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_actors(bs4_movie_page)
+    val = scraper._get_movie_actors(parsed_movie_page)
     val_expected = "George Clooney, Felicity Jones, David Oyelowo"
     assert val == val_expected
-    val = scraper._get_movie_actors(bs4_movie_page_exception)
+    val = scraper._get_movie_actors(parsed_movie_page_exception)
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_nationality(bs4_movie_page):
+def test__get_movie_nationality(parsed_movie_page):
     """Test the page parser to retrieve movie nationality"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_nationality(bs4_movie_page)
+    val = scraper._get_movie_nationality(parsed_movie_page)
     val_expected = "U.S.A."
     assert val == val_expected
 
 
-def test__get_movie_press_rating(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_press_rating(parsed_movie_page, parsed_movie_page_exception):
     """Test the page parser to retrieve movie press rating"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_press_rating(bs4_movie_page)
+    val = scraper._get_movie_ratings(parsed_movie_page)["press_rating"]
     val_expected = 2.5
     assert val == val_expected
-    val = scraper._get_movie_press_rating(bs4_movie_page_exception)
+    val = scraper._get_movie_ratings(parsed_movie_page_exception)["press_rating"]
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_number_of_press_rating(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_number_of_press_rating(parsed_movie_page, parsed_movie_page_exception):
     """Test press rating count extraction.
 
     Verifies that the number of press ratings is correctly extracted,
     and handles cases where ratings are missing.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
-        bs4_movie_page_exception: Fixture providing page content with missing ratings.
+        parsed_movie_page: Fixture providing the parsed movie page node.
+        parsed_movie_page_exception: Fixture providing page content with missing ratings.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_number_of_press_rating(bs4_movie_page)
+    val = scraper._get_movie_ratings(parsed_movie_page)["number_of_press_rating"]
     val_expected = 21.0
     assert val == val_expected
-    val = scraper._get_movie_number_of_press_rating(bs4_movie_page_exception)
+    val = scraper._get_movie_ratings(parsed_movie_page_exception)["number_of_press_rating"]
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_spec_rating(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_spec_rating(parsed_movie_page, parsed_movie_page_exception):
     """Test spectator rating extraction.
 
     Verifies that the spectator rating is correctly extracted and converted
     to float, and handles cases where ratings are missing.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
-        bs4_movie_page_exception: Fixture providing page content with missing ratings.
+        parsed_movie_page: Fixture providing the parsed movie page node.
+        parsed_movie_page_exception: Fixture providing page content with missing ratings.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_spec_rating(bs4_movie_page)
+    val = scraper._get_movie_ratings(parsed_movie_page)["spec_rating"]
     val_expected = 2.4
     assert val == val_expected
-    val = scraper._get_movie_spec_rating(bs4_movie_page_exception)
+    val = scraper._get_movie_ratings(parsed_movie_page_exception)["spec_rating"]
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_number_of_spec_rating(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_number_of_spec_rating(parsed_movie_page, parsed_movie_page_exception):
     """Test the page parser to retrieve movie
     number of spec rating"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_number_of_spec_rating(bs4_movie_page)
+    val = scraper._get_movie_ratings(parsed_movie_page)["number_of_spec_rating"]
     val_expected = 3015.0
     assert val == val_expected
-    val = scraper._get_movie_number_of_spec_rating(bs4_movie_page_exception)
+    val = scraper._get_movie_ratings(parsed_movie_page_exception)["number_of_spec_rating"]
     val_expected = None
     assert val == val_expected
 
 
-def test__get_movie_summary(bs4_movie_page, bs4_movie_page_exception):
+def test__get_movie_summary(parsed_movie_page, parsed_movie_page_exception):
     """Test the page parser to retrieve movie summary"""
     config = ScraperConfig()
     scraper = AllocineScraper(config)
-    val = scraper._get_movie_summary(bs4_movie_page)
+    val = scraper._get_movie_summary(parsed_movie_page)
     val_expected = "Dans ce film post-apocalyptique, Augustine, scientifique solitaire basé en Arctique, tente l’impossible pour empêcher l'astronaute Sully et son équipage de rentrer sur Terre. Car il sait qu’une mystérieuse catastrophe planétaire est imminente...Inspiré du roman éponyme de Lily Brooks-Dalton, plébiscité par la critique."
     assert val == val_expected
-    val = scraper._get_movie_summary(bs4_movie_page_exception)
+    val = scraper._get_movie_summary(parsed_movie_page_exception)
     val_expected = None
     assert val == val_expected
 
 
+def test__get_movie_summary_normalization():
+    """Test that summaries not in NFKC form are normalized."""
+    scraper = AllocineScraper(ScraperConfig())
+    movie = LexborHTMLParser(
+        '<section class="section ovw ovw-synopsis"><div class="content-txt"> Un\xa0film ﬁni </div></section>'
+    )
+    assert scraper._get_movie_summary(movie) == "Un film fini"
+
+
 def test_scraping_movies_with_append(tmp_path, get_dataframe):
     path_dir = tmp_path / "data"
     path_dir.mkdir()
@@ -331,6 +487,168 @@ def test_scraping_movies(tmp_path):
     df_scraper = pd.read_csv(full_dir)
     end_shape = df_scraper.shape
     assert end_shape[0] == 1
+    assert df_scraper["release_date"][0] == "2020-12-23"
+
+
+def test_scraping_movies_with_parquet(tmp_path):
+    """Test the Parquet export of the scraped movies.
+
+    Verifies that the Parquet file holds the same movies as the CSV file,
+    and that append mode keeps the movies exported by a previous run.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    pytest.importorskip("pyarrow")
+    config = ScraperConfig(number_of_pages=1, output_dir=tmp_path, pause_scraping=(0, 1), parquet=True)
+    AllocineScraper(config).scraping_movies()
+
+    df_parquet = pd.read_parquet(config.full_parquet_path)
+    df_csv = pd.read_csv(config.full_output_path)
+    assert df_parquet["id"].tolist() == df_csv["id"].tolist()
+    assert df_parquet["release_date"][0] == datetime.date(2020, 12, 23)
+    assert df_parquet["duration"][0] == 122
+    assert df_parquet["duration"].dtype == "uint16"
+    assert df_parquet["press_rating"].dtype == "float32"
+    assert df_parquet["genres"].dtype == "category"
+
+    # the movie of the listing page is already scraped: the new run only keeps the previous export
+    config.append_result = True
+    AllocineScraper(config).scraping_movies()
+    assert len(pd.read_parquet(config.full_parquet_path)) == len(df_parquet)
+
+
+def test_scraping_movies_twice(tmp_path):
+    """Test running the same scraper twice.
+
+    The second run must append to the CSV file created by the first one, so
+    the file keeps holding every movie of `rows`.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(number_of_pages=1, output_dir=tmp_path, pause_scraping=(0, 1))
+    scraper = AllocineScraper(config)
+    scraper.scraping_movies()
+
+    extract_movie = scraper._extract_movie
+    scraper._parse_page = lambda page: ["/film/fichefilm_gen_cfilm=999.html"]
+    scraper._extract_movie = lambda page: {**extract_movie(page), "id": 999}
+    scraper.scraping_movies()
+    assert [row["id"] for row in scraper.rows] == [275220, 999]
+    assert pd.read_csv(config.full_output_path)["id"].tolist() == [275220, 999]
+
+
+def test_scraping_movies_config_changed_after_init(tmp_path):
+    """Test that the pages to scrape are read from the config at each run.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(number_of_pages=2, output_dir=tmp_path, pause_scraping=(0, 1))
+    scraper = AllocineScraper(config)
+    get_page = scraper._get_page
+    fetched_pages = []
+    scraper._get_page = lambda number: fetched_pages.append(number) or get_page(number)
+    scraper.config.from_page = 5
+    scraper.scraping_movies()
+    assert sorted(fetched_pages) == [5, 6]
+
+
+def test_scraping_movies_stores_movies_while_listing(tmp_path):
+    """Test that movies are scraped before every listing page has been fetched.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(number_of_pages=8, output_dir=tmp_path, pause_scraping=(0, 1), max_concurrency=2)
+    scraper = AllocineScraper(config)
+    get_movie = scraper._get_movie
+    requests_order = []
+
+    def fetch_page(number):
+        requests_order.append(f"P{number}")
+        return [f"/film/fichefilm_gen_cfilm={1000 + number}.html"]
+
+    scraper._fetch_page = fetch_page
+    scraper._get_movie = lambda url: requests_order.append(url) or get_movie(url)
+    scraper.scraping_movies()
+    assert requests_order.index("/film/fichefilm_gen_cfilm=1001.html") < requests_order.index("P3")
+    assert len(requests_order) == 16
+
+
+def test_scraping_movies_several_pages(tmp_path):
+    """Test scraping several listing pages at once.
+
+    Every mocked listing page links several times to the same movie: it must
+    only be fetched and stored once even though the pages are scraped
+    concurrently.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(number_of_pages=3, output_dir=tmp_path, pause_scraping=(0, 1), max_concurrency=2)
+    scraper = AllocineScraper(config)
+    get_movie = scraper._get_movie
+    fetched_urls = []
+    scraper._get_movie = lambda url: fetched_urls.append(url) or get_movie(url)
+    scraper.scraping_movies()
+    assert fetched_urls == ["/film/fichefilm_gen_cfilm=275220.html"]
+    assert len(scraper.rows) == 1
+    assert len(pd.read_csv(config.full_output_path)) == 1
+
+
+def test_get_settings():
+    """Test that the settings are read once and shared by the whole process."""
+    assert get_settings() is get_settings()
+    assert get_settings() is settings
+
+
+def test_scraping_movies_compressed(tmp_path):
+    """Test writing the output CSV gzip compressed.
+
+    Verifies that the output file gets a .gz suffix, and that append mode
+    reads the scraped IDs back from it and keeps it readable as one file.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(number_of_pages=1, output_dir=tmp_path, pause_scraping=(0, 1), compress=True)
+    AllocineScraper(config).scraping_movies()
+    assert config.full_output_path.name == "allocine_movies.csv.gz"
+    assert len(pd.read_csv(config.full_output_path)) == 1
+
+    config.append_result = True
+    scraper = AllocineScraper(config)
+    assert scraper.exclude_ids == {275220}
+    scraper._write_row({**dict.fromkeys(scraper.movie_infos), "id": 1})
+    scraper.close()
+    assert pd.read_csv(config.full_output_path)["id"].tolist() == [275220, 1]
+
+
+def test_scraping_movies_compressed_resume_after_kill(tmp_path):
+    """Test resuming a compressed output left by a killed run.
+
+    Verifies that flushed rows are readable without close(), and that append
+    mode drops a truncated last gzip member instead of failing to read the file.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(output_dir=tmp_path, compress=True)
+    scraper = AllocineScraper(config)
+    for movie_id in range(1, AllocineScraper._FLUSH_EVERY + 1):
+        scraper._write_row({**dict.fromkeys(scraper.movie_infos), "id": movie_id})
+    # the run is killed before close(), in the middle of its next member
+    with open(config.full_output_path, "ab") as gzip_file:
+        gzip_file.write(gzip.compress(b"11,,,,,,,,,,,,\n12,,,,,,,,,,,,\n")[:20])
+
+    config.append_result = True
+    scraper = AllocineScraper(config)
+    assert scraper.exclude_ids == set(range(1, AllocineScraper._FLUSH_EVERY + 1))
+    scraper._write_row({**dict.fromkeys(scraper.movie_infos), "id": 11})
+    scraper.close()
+    assert pd.read_csv(config.full_output_path)["id"].tolist() == list(range(1, AllocineScraper._FLUSH_EVERY + 2))
 
 
 def test_number_of_page_exception():
@@ -412,13 +730,32 @@ def test_parse_page_with_exclude_ids(tmp_path, response_page):
     )
     scraper = AllocineScraper(config)
     scraper.config.append_result = True
-    scraper.exclude_ids = [251354, 229831]  # Exclude first two movies
+    scraper.exclude_ids = {251354, 229831}  # Exclude first two movies
     urls = scraper._parse_page(response_page)
     assert len(urls) == 13  # Original length minus 2
     assert "/film/fichefilm_gen_cfilm=251354.html" not in urls
     assert "/film/fichefilm_gen_cfilm=229831.html" not in urls
 
 
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("/film/fichefilm_gen_cfilm=251354.html", 251354),
+        ("/film/fichefilm_gen_cfilm=338.html", 338),
+        ("/film/agenda/", None),
+    ],
+)
+def test__get_url_movie_id(url, expected):
+    """Test movie ID extraction from movie page URLs.
+
+    Args:
+        url: Relative URL of a page.
+        expected: Expected movie ID.
+    """
+    scraper = AllocineScraper(ScraperConfig())
+    assert scraper._get_url_movie_id(url) == expected
+
+
 def test_randomize_waiting_time_bounds():
     """Test wait time generation bounds.
 
@@ -444,38 +781,139 @@ def test_empty_dataframe_initialization():
     assert len(scraper.df) == 0
 
 
-def test_parse_movie_with_missing_data(response_movie):
+def test__write_row_flushes_in_batches(tmp_path):
+    """Test batched flushing of the CSV output.
+
+    Verifies that rows stay buffered until `_FLUSH_EVERY` movies have been
+    written, and that close() flushes the remaining ones.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+    """
+    config = ScraperConfig(output_dir=tmp_path)
+    scraper = AllocineScraper(config)
+    row = dict.fromkeys(scraper.movie_infos)
+
+    for movie_id in range(scraper._FLUSH_EVERY - 1):
+        scraper._write_row({**row, "id": movie_id})
+    assert config.full_output_path.stat().st_size == 0
+
+    scraper._write_row({**row, "id": scraper._FLUSH_EVERY - 1})
+    assert len(pd.read_csv(config.full_output_path)) == scraper._FLUSH_EVERY
+
+    scraper._write_row({**row, "id": scraper._FLUSH_EVERY})
+    scraper.close()
+    assert len(pd.read_csv(config.full_output_path)) == scraper._FLUSH_EVERY + 1
+
+
+def test_rows_are_not_shared_between_instances(tmp_path, response_movie):
+    """Test that collected movies belong to a single scraper instance.
+
+    Verifies that parsing a movie with one scraper leaves another scraper
+    empty, and that the DataFrame is built from the scraper's own rows.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory path.
+        response_movie: Fixture providing mock movie response.
+    """
+    config = ScraperConfig(output_dir=tmp_path)
+    scraper = AllocineScraper(config)
+    other_scraper = AllocineScraper(config)
+    scraper._parse_movie(response_movie)
+    scraper.close()
+    assert len(scraper.df) == 1
+    assert scraper.df.iloc[0]["id"] == 275220
+    assert other_scraper.rows == []
+    assert other_scraper.df.empty
+
+
+def test__extract_movie(response_movie):
+    """Test that extracting a movie doesn't change the scraper state.
+
+    Extraction runs in worker threads, only storing the movie updates the
+    scraped IDs and the rows.
+
+    Args:
+        response_movie: Fixture providing mock movie page response.
+    """
+    scraper = AllocineScraper(ScraperConfig())
+    movie_datas = scraper._extract_movie(response_movie)
+    assert movie_datas["id"] == 275220
+    assert set(movie_datas) == set(scraper.movie_infos)
+    assert scraper.rows == []
+    assert scraper.exclude_ids == set()
+
+
+def test__extract_movie_without_content_layout():
+    """Test extracting a page without main#content-layout, e.g. a removed movie.
+
+    The error is logged and every info is left to None instead of stopping
+    the whole scrape.
+    """
+    page = Response()
+    page.status_code = 200
+    page._content = b"<html><body><p>gone</p></body></html>"
+    movie_datas = AllocineScraper(ScraperConfig())._extract_movie(page)
+    assert movie_datas == dict.fromkeys(AllocineScraper.movie_infos)
+
+
+def test_parse_movie_with_missing_data(tmp_path, response_movie):
     """Test movie parsing with missing data.
 
     Verifies that the parser handles missing optional fields gracefully
     while still capturing required fields.
 
     Args:
+        tmp_path: Pytest fixture providing temporary directory path.
         response_movie: Fixture providing mock movie response.
     """
-    config = ScraperConfig()
+    config = ScraperConfig(output_dir=tmp_path)
     scraper = AllocineScraper(config)
     response_movie._content = response_movie._content.replace(b"stareval-note", b"missing-note")
     scraper._parse_movie(response_movie)
-    assert scraper.df.iloc[0]["press_rating"] is None
-    assert scraper.df.iloc[0]["title"] is not None
+    scraper.close()
+    assert scraper.rows[0]["press_rating"] is None
+    assert scraper.rows[0]["title"] is not None
 
 
-def test_edge_case_movie_durations(bs4_movie_page):
+def test_edge_case_movie_durations(parsed_movie_page):
     """Test edge cases in movie duration parsing.
 
     Verifies that the duration parser handles empty or missing
     duration information correctly.
 
     Args:
-        bs4_movie_page: Fixture providing parsed BeautifulSoup movie page content.
+        parsed_movie_page: Fixture providing the parsed movie page node.
     """
     config = ScraperConfig()
     scraper = AllocineScraper(config)
 
-    duration_tag = bs4_movie_page.find("span", {"class": "spacer"})
-    duration_tag.next_sibling.replace_with("")
-    assert scraper._get_movie_duration(bs4_movie_page) == ""
+    duration_tag = parsed_movie_page.css_first("span.spacer")
+    duration_tag.next.replace_with("")
+    assert scraper._get_movie_duration(parsed_movie_page) == ""
+
+
+@pytest.mark.parametrize(
+    "duration, expected",
+    [
+        ("2h 02min", 122),
+        ("1h 30min", 90),
+        ("45min", 45),
+        ("3h", 180),
+        ("Inconnue", None),
+    ],
+)
+def test__get_movie_duration_formats(parsed_movie_page, duration, expected):
+    """Test movie duration parsing for the formats displayed by Allocine.
+
+    Args:
+        parsed_movie_page: Fixture providing the parsed movie page node.
+        duration: Duration text displayed on the movie page.
+        expected: Expected duration in minutes.
+    """
+    scraper = AllocineScraper(ScraperConfig())
+    parsed_movie_page.css_first("span.spacer").next.replace_with(duration)
+    assert scraper._get_movie_duration(parsed_movie_page) == expected
 
 
 def test_config_validation_edge_cases():
@@ -493,18 +931,24 @@ def test_config_validation_edge_cases():
     with pytest.raises(ValidationError):
         ScraperConfig(pause_scraping=(5, 3))  # Max should be > min
 
+    with pytest.raises(ValidationError):
+        ScraperConfig(max_concurrency=0)  # Should be > 0
+
 
-def test_parse_movie_duplicate_handling(response_movie):
+def test_parse_movie_duplicate_handling(tmp_path, response_movie):
     """Test handling of duplicate movie entries.
 
     Verifies that duplicate movies are properly handled when parsing,
-    ensuring only one copy of each movie is kept in the DataFrame.
+    ensuring only one copy of each movie is kept and written to the CSV.
 
     Args:
+        tmp_path: Pytest fixture providing temporary directory path.
         response_movie: Fixture providing mock movie response.
     """
-    config = ScraperConfig(append_result=True)
+    config = ScraperConfig(output_dir=tmp_path)
     scraper = AllocineScraper(config)
     scraper._parse_movie(response_movie)
     scraper._parse_movie(response_movie)
-    assert len(scraper.df) == 1
+    scraper.close()
+    assert len(scraper.rows) == 1
+    assert len(pd.read_csv(config.full_output_path)) == 1